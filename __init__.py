@@ -3,9 +3,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import TYPE_CHECKING
 
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.setup import async_when_setup
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,16 +23,20 @@ NEXIA_DOMAIN = "nexia"
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Nexia Room IQ Sensors component."""
     _LOGGER.info("Nexia Room IQ Sensors integration starting")
-    
-    # Wait a bit to ensure Nexia integration has loaded
-    await asyncio.sleep(3)
-    
+
+    # Inject once the Nexia integration has finished loading
+    async_when_setup(hass, NEXIA_DOMAIN, _async_inject_roomiq_sensors)
+    return True
+
+
+async def _async_inject_roomiq_sensors(hass: HomeAssistant, component: str) -> None:
+    """Inject Room IQ sensors into Nexia and reload it to activate them."""
     try:
         # Check if Nexia has config entries
         nexia_entries = hass.config_entries.async_entries(NEXIA_DOMAIN)
         if not nexia_entries:
             _LOGGER.error("No Nexia integration found. Please set up Nexia first.")
-            return False
+            return
         
         _LOGGER.debug("Found Nexia integration, injecting Room IQ sensor setup")
         
@@ -34,17 +45,42 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         
         inject_roomiq_sensors(nexia_sensor)
         
-        # Reload Nexia to activate the injection
-        _LOGGER.debug("Reloading Nexia integration to activate Room IQ sensors")
-        for entry in nexia_entries:
-            await hass.config_entries.async_reload(entry.entry_id)
+        # Reload only Nexia's sensor platform to activate the injection, for
+        # all loaded Nexia entries at once; entries that load later already
+        # use the patched setup
+        loaded_entries = [
+            entry
+            for entry in nexia_entries
+            if entry.state is ConfigEntryState.LOADED
+        ]
+        _LOGGER.debug("Reloading Nexia sensor platform to activate Room IQ sensors")
+        results = await asyncio.gather(
+            *(_async_reload_sensor_platform(hass, entry) for entry in loaded_entries),
+            return_exceptions=True,
+        )
+        for entry, result in zip(loaded_entries, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Failed to reload Nexia sensors for %s: %s",
+                    entry.title,
+                    result,
+                    exc_info=result,
+                )
         
         _LOGGER.info("Nexia Room IQ Sensors setup complete")
-        return True
         
     except Exception as err:
         _LOGGER.error("Failed to set up Room IQ sensors: %s", err, exc_info=True)
-        return False
-
 
 
+async def _async_reload_sensor_platform(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> None:
+    """Reload the sensor platform of a Nexia config entry."""
+    async with entry.setup_lock:
+        # The entry may have been unloaded or reloaded while waiting for the lock
+        if entry.state is not ConfigEntryState.LOADED:
+            _LOGGER.debug("Skipping Nexia sensor reload for %s, not loaded", entry.title)
+            return
+        await hass.config_entries.async_unload_platforms(entry, [Platform.SENSOR])
+        await hass.config_entries.async_forward_entry_setups(entry, [Platform.SENSOR])
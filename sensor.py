@@ -3,6 +3,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, TYPE_CHECKING
 
 from nexia.const import UNIT_CELSIUS
@@ -13,6 +17,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -25,15 +30,22 @@ from homeassistant.components.nexia.entity import NexiaThermostatZoneEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-# Store the original setup function and update method
+# Store the original setup function and the coordinators already wrapped
 _original_async_setup_entry = None
-_original_update_method = {}
+_wrapped_coordinators: weakref.WeakSet[NexiaDataUpdateCoordinator] = weakref.WeakSet()
 _injection_complete = False  # Flag to prevent re-injection
 
 # The key used in hass.data for the coordinator
 NEXIA_DOMAIN = "nexia"
 UPDATE_COORDINATOR = "update_coordinator"
 
+# Seconds to wait after a fresh data request before fetching from the cloud;
+# based on mobile app behavior, Room IQ takes 3-5 seconds to update
+_REFRESH_DELAY = 5
+
+# Updates within this many seconds of a fresh data request skip requesting again
+_REFRESH_MIN_INTERVAL = 30
+
 
 def inject_roomiq_sensors(nexia_sensor_module):
     """Inject Room IQ sensor setup into the Nexia sensor platform."""
@@ -64,12 +76,9 @@ async def _async_setup_entry_wrapper(
     if _original_async_setup_entry:
         await _original_async_setup_entry(hass, config_entry, async_add_entities)
     
-    # Now add our Room IQ sensors
+    # Now add our Room IQ sensors; the original setup has already populated
+    # the coordinator, so there is nothing to wait for
     _LOGGER.debug("Adding Room IQ sensors to Nexia integration")
-    
-    # Small delay to ensure Nexia data is populated
-    await asyncio.sleep(0.5)
-    
     await async_setup_roomiq_sensors(hass, config_entry, async_add_entities)
 
 
@@ -93,225 +102,309 @@ async def async_setup_roomiq_sensors(
         )
         return
     
-    nexia_home = coordinator.nexia_home
-    
-    # Wrap the coordinator's update method to request fresh Room IQ data
-    if id(coordinator) not in _original_update_method:
-        _LOGGER.debug("Wrapping coordinator update method to request fresh Room IQ data")
-        _LOGGER.debug("Coordinator ID: %s", id(coordinator))
-        
-        # Save original method
-        _original_update_method[id(coordinator)] = coordinator._async_update_data
-        _LOGGER.debug("Original update method saved: %s", coordinator._async_update_data)
-        
-        async def _update_with_roomiq_refresh():
-            """Update method that requests fresh Room IQ data first."""
+    # Wrap the coordinator's update method to request fresh Room IQ data; the
+    # check-and-wrap never awaits, so it cannot interleave with another setup
+    _wrap_coordinator_update(coordinator)
+
+    # Build the initial index from the data Nexia already loaded
+    _index_roomiq_sensors(coordinator)
+
+    # Start from scratch, the platform's previous entities are gone on (re)setup
+    known_sensor_ids: set[tuple[int, int, str]] = set()
+
+    @callback
+    def _async_add_new_sensors() -> None:
+        """Add entities for Room IQ sensors that have not been seen yet."""
+        entities: list[SensorEntity] = []
+
+        # Add Room IQ sensors for each zone
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        for thermostat, zone in _get_zones(coordinator):
+            if debug:
+                _LOGGER.debug(
+                    "Checking for Room IQ sensors in zone: %s", zone.get_name()
+                )
+            entities.extend(
+                _create_roomiq_sensors(coordinator, zone, thermostat, known_sensor_ids)
+            )
+
+        if entities:
+            _LOGGER.info("Adding %d Room IQ sensor entities", len(entities))
+            async_add_entities(entities)
+
+    _async_add_new_sensors()
+
+    # Pick up sensors paired later on each coordinator update; replace any
+    # listener left over from a previous setup of this platform
+    if remove_listener := getattr(coordinator, "_roomiq_remove_listener", None):
+        remove_listener()
+    coordinator._roomiq_remove_listener = coordinator.async_add_listener(
+        _async_add_new_sensors
+    )
+
+    @callback
+    def _async_stop_discovery() -> None:
+        """Stop adding Room IQ sensors when the entry unloads."""
+        if remove_listener := coordinator._roomiq_remove_listener:
+            coordinator._roomiq_remove_listener = None
+            remove_listener()
+
+    config_entry.async_on_unload(_async_stop_discovery)
+
+
+def _wrap_coordinator_update(coordinator: NexiaDataUpdateCoordinator) -> None:
+    """Wrap the coordinator's update method to request fresh Room IQ data."""
+    if coordinator in _wrapped_coordinators:
+        _LOGGER.debug("Coordinator already wrapped (ID: %s)", id(coordinator))
+        return
+
+    _LOGGER.debug("Wrapping coordinator update method to request fresh Room IQ data")
+    _LOGGER.debug("Coordinator ID: %s", id(coordinator))
+
+    # Save the original method on the coordinator so it is freed along with it
+    coordinator._roomiq_original_update = coordinator._async_update_data
+    _LOGGER.debug("Original update method saved: %s", coordinator._async_update_data)
+
+    # Allow one fresh data request at a time, and at most one per interval
+    coordinator._roomiq_refresh_lock = asyncio.Lock()
+    coordinator._roomiq_last_refresh = None  # Never refreshed
+
+    async def _update_with_roomiq_refresh():
+        """Update method that requests fresh Room IQ data first."""
+        async with coordinator._roomiq_refresh_lock:
+            last_refresh = coordinator._roomiq_last_refresh
+            if (
+                last_refresh is not None
+                and time.monotonic() - last_refresh < _REFRESH_MIN_INTERVAL
+            ):
+                # Fresh data was requested moments ago, just fetch from the cloud
+                _LOGGER.debug("Room IQ data recently refreshed, skipping fresh request")
+                result = await coordinator._roomiq_original_update()
+                _index_roomiq_sensors(coordinator)
+                return result
+
             _LOGGER.debug("Room IQ refresh wrapper called - requesting fresh sensor data")
+            requested = False
             try:
-                # Request fresh sensor data from each zone
-                for thermostat_id in nexia_home.get_thermostat_ids():
-                    thermostat = nexia_home.get_thermostat_by_id(thermostat_id)
-                    for zone_id in thermostat.get_zone_ids():
-                        zone = thermostat.get_zone_by_id(zone_id)
-                        try:
-                            # Use load_current_sensor_state to request fresh data from physical thermostat
+                # Only zones with Room IQ sensors have anything to refresh
+                zones = [
+                    zone
+                    for _, zone in _get_zones(coordinator)
+                    if getattr(zone, "_roomiq_sensors_by_id", None)
+                ]
+                debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+                # Request fresh sensor data from every zone at once; this tells each
+                # physical thermostat to send fresh sensor data to the cloud
+                results = await asyncio.gather(
+                    *(zone.load_current_sensor_state() for zone in zones),
+                    return_exceptions=True,
+                )
+
+                for zone, zone_result in zip(zones, results):
+                    if isinstance(zone_result, BaseException):
+                        _LOGGER.warning(
+                            "Could not request fresh Room IQ data for zone %s: %s",
+                            zone.get_name(),
+                            zone_result,
+                            exc_info=zone_result,
+                        )
+                    else:
+                        requested = True
+                        if debug:
                             _LOGGER.debug(
-                                "Requesting fresh Room IQ data from physical thermostat for zone: %s",
-                                zone.get_name()
-                            )
-                            # This tells the physical thermostat to send fresh sensor data to the cloud
-                            await zone.load_current_sensor_state()
-                            _LOGGER.debug("Fresh data request sent for zone: %s", zone.get_name())
-                        except Exception as zone_err:
-                            _LOGGER.warning(
-                                "Could not request fresh Room IQ data for zone %s: %s",
-                                zone.get_name(),
-                                zone_err,
-                                exc_info=True
+                                "Fresh data request sent for zone: %s", zone.get_name()
                             )
-                
-                # Wait for the thermostat to upload fresh Room IQ data to the cloud
-                # Based on mobile app behavior, Room IQ takes 3-5 seconds to update
-                _LOGGER.debug("Waiting 5 seconds for fresh Room IQ data to reach cloud...")
-                await asyncio.sleep(5)
-                
+
             except Exception as err:
                 _LOGGER.warning("Error in Room IQ refresh wrapper: %s", err, exc_info=True)
-            
+
+            if requested:
+                coordinator._roomiq_last_refresh = time.monotonic()
+
+                # Wait for the thermostats to upload fresh Room IQ data to the cloud;
+                # skipped when no request went through, as there is nothing to wait for
+                _LOGGER.debug(
+                    "Waiting %s seconds for fresh Room IQ data to reach cloud...",
+                    _REFRESH_DELAY,
+                )
+                await asyncio.sleep(_REFRESH_DELAY)
+
             # Call the original update method to fetch the now-fresh data from cloud
             _LOGGER.debug("Calling original coordinator update method")
-            result = await _original_update_method[id(coordinator)]()
+            result = await coordinator._roomiq_original_update()
+
+            # Index the refreshed Room IQ sensors so entities can look them up by id
+            _index_roomiq_sensors(coordinator)
             _LOGGER.debug("Coordinator update completed")
             return result
-        
-        coordinator._async_update_data = _update_with_roomiq_refresh
-        _LOGGER.debug("Coordinator update method successfully wrapped")
-    else:
-        _LOGGER.debug("Coordinator already wrapped (ID: %s)", id(coordinator))
 
-    entities: list[SensorEntity] = []
+    coordinator._async_update_data = _update_with_roomiq_refresh
+    _wrapped_coordinators.add(coordinator)
+    _LOGGER.debug("Coordinator update method successfully wrapped")
 
-    # Add Room IQ sensors for each zone
-    for thermostat_id in nexia_home.get_thermostat_ids():
-        thermostat = nexia_home.get_thermostat_by_id(thermostat_id)
 
+def _get_zones(coordinator: NexiaDataUpdateCoordinator) -> list[tuple[Any, Any]]:
+    """Return a (thermostat, zone) pair for every zone in the Nexia home.
+
+    The pairs are cached on the coordinator and rebuilt only when the set of
+    thermostats changes.
+    """
+    nexia_home = coordinator.nexia_home
+    thermostat_ids = list(nexia_home.get_thermostat_ids())
+    if getattr(coordinator, "_roomiq_thermostat_ids", None) == thermostat_ids:
+        return coordinator._roomiq_zones
+
+    zones = []
+    for thermostat_id in thermostat_ids:
+        thermostat = nexia_home.get_thermostat_by_id(thermostat_id)
         for zone_id in thermostat.get_zone_ids():
-            zone = thermostat.get_zone_by_id(zone_id)
+            zones.append((thermostat, thermostat.get_zone_by_id(zone_id)))
 
-            _LOGGER.debug("Checking for Room IQ sensors in zone: %s", zone.get_name())
-            entities.extend(_create_roomiq_sensors(coordinator, zone, thermostat))
+    coordinator._roomiq_zones = zones
+    coordinator._roomiq_thermostat_ids = thermostat_ids
+    return zones
 
-    if entities:
-        _LOGGER.info("Adding %d Room IQ sensor entities", len(entities))
-    
-    async_add_entities(entities)
+
+def _index_roomiq_sensors(coordinator: NexiaDataUpdateCoordinator) -> None:
+    """Attach each zone's Room IQ sensors, keyed by sensor id, to the zone.
+
+    The index is updated in place so entities can hold on to it. This runs
+    inside Nexia's coordinator update, so malformed zone data only empties
+    that zone's index and never fails the update.
+    """
+    for _, zone in _get_zones(coordinator):
+        sensors_by_id = getattr(zone, "_roomiq_sensors_by_id", None)
+        if sensors_by_id is None:
+            sensors_by_id = zone._roomiq_sensors_by_id = {}
+
+        sensors_by_id.clear()
+        try:
+            sensors_by_id.update(_parse_roomiq_sensors(zone))
+        except (AttributeError, KeyError, TypeError) as err:
+            sensors_by_id.clear()
+            _LOGGER.warning(
+                "Could not read Room IQ sensors for zone %s: %s",
+                zone.get_name(),
+                err,
+            )
+
+
+def _parse_roomiq_sensors(zone) -> dict[Any, dict[str, Any]]:
+    """Return the zone's well-formed Room IQ sensor dicts keyed by sensor id."""
+    zone_data = getattr(zone, "_zone_json", None)
+    if not isinstance(zone_data, dict):
+        return {}
+
+    room_iq_feature = next(
+        (
+            feature
+            for feature in zone_data.get("features") or []
+            if isinstance(feature, dict)
+            and feature.get("name") == "room_iq_sensors"
+        ),
+        None,
+    )
+    if room_iq_feature is None:
+        return {}
+
+    return {
+        sensor["id"]: sensor
+        for sensor in room_iq_feature.get("sensors") or []
+        if isinstance(sensor, dict) and sensor.get("id")
+    }
 
 
 def _create_roomiq_sensors(
     coordinator: NexiaDataUpdateCoordinator,
     zone,
     thermostat,
+    known_sensor_ids: set[tuple[int, int, str]],
 ) -> list[NexiaRoomIQSensor]:
-    """Create Room IQ sensor entities for a zone."""
-    entities = []
-
-    try:
-        # Access the zone's raw JSON data to get room_iq_sensors
-        zone_data = getattr(zone, "_zone_json", None)
+    """Create the zone's Room IQ entities not yet in known_sensor_ids.
 
-        if zone_data is None:
-            _LOGGER.debug("Could not access zone JSON data for %s", zone.get_name())
-            return entities
-
-        # Navigate through the features array to find room_iq_sensors
-        features = zone_data.get("features", [])
-        room_iq_feature = None
-
-        for feature in features:
-            if feature.get("name") == "room_iq_sensors":
-                room_iq_feature = feature
-                break
+    known_sensor_ids holds (zone_id, sensor_id, sensor_type) keys; a key is
+    added once its entity has been built, so types that become valid later
+    are still picked up.
+    """
+    entities = []
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
-        if not room_iq_feature:
+    # Use the index attached to the zone from its room_iq_sensors feature
+    sensors_by_id = getattr(zone, "_roomiq_sensors_by_id", {})
+    if not sensors_by_id:
+        if debug:
+            _LOGGER.debug("No Room IQ sensors found for zone %s", zone.get_name())
+        return entities
+
+    for sensor_id, sensor_data in sensors_by_id.items():
+        # Temperature and humidity sensors if valid, battery if valid and
+        # present, and the weight sensor always
+        sensor_types = []
+        if sensor_data.get("temperature_valid", False):
+            sensor_types.append("temperature")
+        if sensor_data.get("humidity_valid", False):
+            sensor_types.append("humidity")
+        if sensor_data.get("has_battery", False) and sensor_data.get(
+            "battery_valid", False
+        ):
+            sensor_types.append("battery")
+        sensor_types.append("weight")
+
+        new_types = [
+            sensor_type
+            for sensor_type in sensor_types
+            if (zone.zone_id, sensor_id, sensor_type) not in known_sensor_ids
+        ]
+        if not new_types:
+            continue
+
+        sensor_name = sensor_data.get("name")
+        if not sensor_name:
+            _LOGGER.warning("Sensor missing id or name: %s", sensor_data)
+            continue
+
+        if debug:
             _LOGGER.debug(
-                "No room_iq_sensors feature found for zone %s", zone.get_name()
+                "Processing Room IQ sensor: ID=%s, Name=%s",
+                sensor_id,
+                sensor_name,
             )
-            return entities
-
-        sensors = room_iq_feature.get("sensors", [])
 
-        if not sensors:
-            _LOGGER.debug("No Room IQ sensors found for zone %s", zone.get_name())
-            return entities
-
-        _LOGGER.info(
-            "Found %d Room IQ sensor(s) for zone %s",
-            len(sensors),
-            zone.get_name(),
-        )
-
-        for sensor_data in sensors:
+        for sensor_type in new_types:
             try:
-                sensor_id = sensor_data.get("id")
-                sensor_name = sensor_data.get("name")
-
-                if not sensor_id or not sensor_name:
-                    _LOGGER.warning("Sensor missing id or name: %s", sensor_data)
-                    continue
-
-                _LOGGER.debug(
-                    "Processing Room IQ sensor: ID=%s, Name=%s",
+                entity = _SENSOR_CLASSES[sensor_type](
+                    coordinator,
+                    zone,
+                    thermostat,
                     sensor_id,
                     sensor_name,
                 )
-
-                # Create temperature sensor if valid
-                if sensor_data.get("temperature_valid", False):
-                    entities.append(
-                        NexiaRoomIQSensor(
-                            coordinator,
-                            zone,
-                            thermostat,
-                            sensor_id,
-                            sensor_name,
-                            "temperature",
-                        )
-                    )
-                    _LOGGER.debug(
-                        "Added temperature sensor for %s: %s°F",
-                        sensor_name,
-                        sensor_data.get("temperature"),
-                    )
-
-                # Create humidity sensor if valid
-                if sensor_data.get("humidity_valid", False):
-                    entities.append(
-                        NexiaRoomIQSensor(
-                            coordinator,
-                            zone,
-                            thermostat,
-                            sensor_id,
-                            sensor_name,
-                            "humidity",
-                        )
-                    )
-                    _LOGGER.debug(
-                        "Added humidity sensor for %s: %s%%",
-                        sensor_name,
-                        sensor_data.get("humidity"),
-                    )
-
-                # Create battery sensor if valid and has battery
-                if sensor_data.get("has_battery", False) and sensor_data.get(
-                    "battery_valid", False
-                ):
-                    entities.append(
-                        NexiaRoomIQSensor(
-                            coordinator,
-                            zone,
-                            thermostat,
-                            sensor_id,
-                            sensor_name,
-                            "battery",
-                        )
-                    )
-                    _LOGGER.debug(
-                        "Added battery sensor for %s: %s%%",
-                        sensor_name,
-                        sensor_data.get("battery_level"),
-                    )
-
-                # Create weight sensor (always present)
-                entities.append(
-                    NexiaRoomIQSensor(
-                        coordinator,
-                        zone,
-                        thermostat,
-                        sensor_id,
-                        sensor_name,
-                        "weight",
-                    )
-                )
-                _LOGGER.debug(
-                    "Added weight sensor for %s: %s",
-                    sensor_name,
-                    sensor_data.get("weight", 0.0),
-                )
-
             except Exception as err:
                 _LOGGER.warning(
-                    "Error creating sensors for Room IQ sensor %s: %s",
-                    sensor_name if "sensor_name" in locals() else "unknown",
+                    "Error creating %s sensor for Room IQ sensor %s: %s",
+                    sensor_type,
+                    sensor_name,
                     err,
                     exc_info=True,
                 )
+                continue
 
-    except Exception as err:
-        _LOGGER.warning(
-            "Unexpected error getting Room IQ sensors for zone %s: %s",
+            entities.append(entity)
+            known_sensor_ids.add((zone.zone_id, sensor_id, sensor_type))
+            if debug:
+                _LOGGER.debug(
+                    "Added %s sensor for %s: %s",
+                    sensor_type,
+                    sensor_name,
+                    entity.native_value,
+                )
+
+    if entities:
+        _LOGGER.info(
+            "Found %d new Room IQ entities for zone %s",
+            len(entities),
             zone.get_name(),
-            err,
-            exc_info=True,
         )
 
     return entities
@@ -321,33 +414,11 @@ class NexiaRoomIQSensor(NexiaThermostatZoneEntity, SensorEntity):
     """Nexia Room IQ Sensor (Temperature, Humidity, Battery, or Weight)."""
 
     _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
-    # Sensor type configurations
-    SENSOR_CONFIGS = {
-        "temperature": {
-            "device_class": SensorDeviceClass.TEMPERATURE,
-            "state_class": SensorStateClass.MEASUREMENT,
-            "translation_key": "room_iq_temperature",
-        },
-        "humidity": {
-            "device_class": SensorDeviceClass.HUMIDITY,
-            "state_class": SensorStateClass.MEASUREMENT,
-            "unit": PERCENTAGE,
-            "translation_key": "room_iq_humidity",
-        },
-        "battery": {
-            "device_class": SensorDeviceClass.BATTERY,
-            "state_class": SensorStateClass.MEASUREMENT,
-            "unit": PERCENTAGE,
-            "translation_key": "room_iq_battery",
-        },
-        "weight": {
-            "device_class": None,
-            "state_class": SensorStateClass.MEASUREMENT,
-            "unit": None,
-            "translation_key": "room_iq_weight",
-        },
-    }
+    # Set by the per-type subclasses below
+    _sensor_type: str
+    _name_suffix: str
 
     def __init__(
         self,
@@ -356,145 +427,124 @@ class NexiaRoomIQSensor(NexiaThermostatZoneEntity, SensorEntity):
         thermostat,
         sensor_id: int,
         sensor_name: str,
-        sensor_type: str,
     ) -> None:
         """Initialize the Room IQ sensor."""
+        sensor_type = self._sensor_type
+
         # Initialize parent class with required unique_id
         unique_id = f"{zone.zone_id}_roomiq_{sensor_id}_{sensor_type}"
         super().__init__(coordinator, zone, unique_id)
 
         self._sensor_id = sensor_id
         self._sensor_name = sensor_name
-        self._sensor_type = sensor_type
         self._thermostat = thermostat
+
+        # Shared with the zone and refreshed in place on every coordinator update
+        self._sensors_by_id: dict[int, dict[str, Any]] = zone._roomiq_sensors_by_id
         
-        # Build the entity name
-        # For weight, use "RoomIQ Weight" format
-        # For others, just use sensor name and type
-        if sensor_type == "weight":
-            self._attr_name = f"{sensor_name} RoomIQ Weight"
-        else:
-            self._attr_name = f"{sensor_name} {sensor_type.title()}"
-
-        # Apply configuration for this sensor type
-        config = self.SENSOR_CONFIGS[sensor_type]
-        self._attr_device_class = config["device_class"]
-        self._attr_state_class = config["state_class"]
-        self._attr_translation_key = config["translation_key"]
-
-        # Set unit of measurement
+        # Build the entity name from the sensor name and the type's suffix
+        self._attr_name = f"{sensor_name} {self._name_suffix}"
+
+        # Use thermostat's temperature unit
         if sensor_type == "temperature":
-            # Use thermostat's temperature unit
             if thermostat.get_unit() == UNIT_CELSIUS:
                 self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
             else:
                 self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-        else:
-            self._attr_native_unit_of_measurement = config.get("unit")
+
+        self._update_cached_state()
 
     def _get_sensor_data(self) -> dict[str, Any] | None:
-        """Get the sensor data from the zone's JSON."""
-        try:
-            zone_data = getattr(self._zone, "_zone_json", None)
-            if zone_data is None:
-                return None
-
-            features = zone_data.get("features", [])
-            for feature in features:
-                if feature.get("name") == "room_iq_sensors":
-                    sensors = feature.get("sensors", [])
-                    for sensor in sensors:
-                        if sensor.get("id") == self._sensor_id:
-                            return sensor
-        except Exception as err:
-            _LOGGER.debug(
-                "Error getting sensor data for %s (ID: %s): %s",
-                self._sensor_name,
-                self._sensor_id,
-                err,
-            )
-        return None
+        """Get the sensor data from the zone's Room IQ index."""
+        return self._sensors_by_id.get(self._sensor_id)
+
+    def _update_cached_state(self) -> None:
+        """Resolve the sensor's value, attributes and availability once."""
+        sensor_data = self._get_sensor_data()
+        self._cached_value = self._read_native_value(sensor_data)
+        self._cached_attrs = self._read_extra_state_attributes(sensor_data)
+        self._cached_available = self._read_available(sensor_data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state, then write it."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> float | int | None:
         """Return the state of the sensor."""
-        sensor_data = self._get_sensor_data()
+        return self._cached_value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes."""
+        return self._cached_attrs
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self._cached_available
+
+    def _read_native_value(
+        self, sensor_data: dict[str, Any] | None
+    ) -> float | int | None:
+        """Read the state of the sensor from its data."""
         if sensor_data is None:
             return None
 
-        try:
-            if self._sensor_type == "temperature":
-                if sensor_data.get("temperature_valid", False):
-                    return sensor_data.get("temperature")
-            elif self._sensor_type == "humidity":
-                if sensor_data.get("humidity_valid", False):
-                    return sensor_data.get("humidity")
-            elif self._sensor_type == "battery":
-                if sensor_data.get("battery_valid", False):
-                    return sensor_data.get("battery_level")
-            elif self._sensor_type == "weight":
-                return sensor_data.get("weight", 0.0)
-        except Exception as err:
-            _LOGGER.debug(
-                "Error reading %s for sensor %s: %s",
-                self._sensor_type,
-                self._sensor_name,
-                err,
-            )
+        if self._sensor_type == "temperature":
+            if sensor_data.get("temperature_valid", False):
+                return sensor_data.get("temperature")
+        elif self._sensor_type == "humidity":
+            if sensor_data.get("humidity_valid", False):
+                return sensor_data.get("humidity")
+        elif self._sensor_type == "battery":
+            if sensor_data.get("battery_valid", False):
+                return sensor_data.get("battery_level")
+        elif self._sensor_type == "weight":
+            return sensor_data.get("weight", 0.0)
 
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _read_extra_state_attributes(
+        self, sensor_data: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Read the state attributes from the sensor's data."""
         attrs = {}
 
-        sensor_data = self._get_sensor_data()
         if sensor_data is None:
             return attrs
 
-        try:
-            attrs["sensor_id"] = self._sensor_id
-            attrs["sensor_name"] = self._sensor_name
-            attrs["sensor_type"] = sensor_data.get("type")
-            attrs["serial_number"] = sensor_data.get("serial_number")
-
-            # Add weight (indicates sensor's contribution to zone average)
-            attrs["weight"] = sensor_data.get("weight", 0.0)
-
-            # Add connection status for wireless sensors
-            if sensor_data.get("has_online", False):
-                attrs["connected"] = sensor_data.get("connected", False)
-
-            # Add battery information for wireless sensors
-            if sensor_data.get("has_battery", False):
-                if sensor_data.get("battery_valid", False):
-                    attrs["battery_level"] = sensor_data.get("battery_level")
-                    attrs["battery_low"] = sensor_data.get("battery_low", False)
-
-            # For non-battery sensors, include all sensor readings
-            if self._sensor_type != "battery":
-                if sensor_data.get("temperature_valid", False):
-                    attrs["temperature"] = sensor_data.get("temperature")
-                if sensor_data.get("humidity_valid", False):
-                    attrs["humidity"] = sensor_data.get("humidity")
-
-        except Exception as err:
-            _LOGGER.debug(
-                "Error reading attributes for sensor %s: %s",
-                self._sensor_name,
-                err,
-            )
+        attrs["sensor_id"] = self._sensor_id
+        attrs["sensor_name"] = self._sensor_name
+        attrs["sensor_type"] = sensor_data.get("type")
+        attrs["serial_number"] = sensor_data.get("serial_number")
 
-        return attrs
+        # Add weight (indicates sensor's contribution to zone average)
+        attrs["weight"] = sensor_data.get("weight", 0.0)
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not super().available:
-            return False
+        # Add connection status for wireless sensors
+        if sensor_data.get("has_online", False):
+            attrs["connected"] = sensor_data.get("connected", False)
 
-        sensor_data = self._get_sensor_data()
+        # Add battery information for wireless sensors
+        if sensor_data.get("has_battery", False):
+            if sensor_data.get("battery_valid", False):
+                attrs["battery_level"] = sensor_data.get("battery_level")
+                attrs["battery_low"] = sensor_data.get("battery_low", False)
+
+        # For non-battery sensors, include all sensor readings
+        if self._sensor_type != "battery":
+            if sensor_data.get("temperature_valid", False):
+                attrs["temperature"] = sensor_data.get("temperature")
+            if sensor_data.get("humidity_valid", False):
+                attrs["humidity"] = sensor_data.get("humidity")
+
+        return attrs
+
+    def _read_available(self, sensor_data: dict[str, Any] | None) -> bool:
+        """Read whether the sensor's data is usable."""
         if sensor_data is None:
             return False
 
@@ -508,16 +558,63 @@ class NexiaRoomIQSensor(NexiaThermostatZoneEntity, SensorEntity):
             return True
 
         # Check if the value we're tracking is valid
-        try:
-            if self._sensor_type == "temperature":
-                return sensor_data.get("temperature_valid", False)
-            elif self._sensor_type == "humidity":
-                return sensor_data.get("humidity_valid", False)
-            elif self._sensor_type == "battery":
-                return sensor_data.get("battery_valid", False) and sensor_data.get(
-                    "has_battery", False
-                )
-        except Exception:
-            return False
+        if self._sensor_type == "temperature":
+            return sensor_data.get("temperature_valid", False)
+        elif self._sensor_type == "humidity":
+            return sensor_data.get("humidity_valid", False)
+        elif self._sensor_type == "battery":
+            return sensor_data.get("battery_valid", False) and sensor_data.get(
+                "has_battery", False
+            )
 
         return False
+
+
+class _RoomIQTemperatureSensor(NexiaRoomIQSensor):
+    """Room IQ temperature sensor."""
+
+    _sensor_type = "temperature"
+    _name_suffix = "Temperature"
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_translation_key = "room_iq_temperature"
+
+
+class _RoomIQHumiditySensor(NexiaRoomIQSensor):
+    """Room IQ humidity sensor."""
+
+    _sensor_type = "humidity"
+    _name_suffix = "Humidity"
+    _attr_device_class = SensorDeviceClass.HUMIDITY
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_translation_key = "room_iq_humidity"
+
+
+class _RoomIQBatterySensor(NexiaRoomIQSensor):
+    """Room IQ battery sensor."""
+
+    _sensor_type = "battery"
+    _name_suffix = "Battery"
+    _attr_device_class = SensorDeviceClass.BATTERY
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_translation_key = "room_iq_battery"
+
+
+class _RoomIQWeightSensor(NexiaRoomIQSensor):
+    """Room IQ weight sensor (contribution to the zone average)."""
+
+    _sensor_type = "weight"
+    _name_suffix = "RoomIQ Weight"
+    _attr_device_class = None
+    _attr_native_unit_of_measurement = None
+    _attr_translation_key = "room_iq_weight"
+
+
+# Entity class for each Room IQ sensor type
+_SENSOR_CLASSES: Mapping[str, type[NexiaRoomIQSensor]] = MappingProxyType(
+    {
+        "temperature": _RoomIQTemperatureSensor,
+        "humidity": _RoomIQHumiditySensor,
+        "battery": _RoomIQBatterySensor,
+        "weight": _RoomIQWeightSensor,
+    }
+)